@@ -25,12 +25,20 @@ stamp/point name ('Name') and ID ('ID').
 - Place GPX files for finished tours in the 'tours' directory. They will be automatically loaded and plotted on the map.
 - Run the script to generate the map. The output will be an HTML file named 'map.html'.
 - Open 'map.html' in a web browser to interact with the map.
+- Pass '--gzip' to additionally save a compressed 'map.html.gz', e.g. for serving the map from a web server.
+- If none of the inputs changed since 'map.html' was generated, the existing map is reused. Pass '--no_cache' to
+regenerate it anyway.
 
 Dependencies:
 - folium: For map creation and manipulation.
 - pandas: For data manipulation and reading from CSV.
-- gpxpy: For parsing GPX files.
+- numpy: For vectorized operations on the stamp and track data.
+- jinja2: For rendering the stamp marker script (installed together with folium).
 - os, itertools: For file and data manipulation.
+- xml.etree: For parsing GPX files.
+- concurrent.futures: For parsing GPX files in parallel.
+- hashlib: For fingerprinting the inputs of a generated map.
+- gzip: For saving a compressed copy of the map.
 - argparse: For command line argument parsing.
 
 Note:
@@ -44,15 +52,26 @@ Version: 1.3
 """
 
 import argparse
+import concurrent.futures
+import hashlib
 import json
+import math
 import os
 import enum
-import gpxpy
+import gzip
+import xml.etree.ElementTree
 import folium  # type: ignore
+import jinja2
+import numpy
 import pandas
 import webbrowser
 import itertools
 
+# GPX files are parsed at roughly 12 MB/s, while starting a worker process costs up to a second (with the spawn start
+# method, each worker re-imports this script with folium and pandas). Below this total size, parsing in parallel
+# processes costs more than it saves.
+GPX_PARALLEL_MIN_BYTES = 16 * 1024 * 1024
+
 
 class Translator:
     def __init__(self, localization_json_path: str):
@@ -72,25 +91,93 @@ class StampStatus(enum.Enum):
     BONUS: int = 3  # Unvisited stamp without associated challenge
 
 
+class StampColumns:
+    def __init__(self, translator: Translator):
+        self.lat = translator.translate("COL_LAT")
+        self.lon = translator.translate("COL_LON")
+        self.name = translator.translate("COL_NAME")
+        self.id = translator.translate("COL_ID")
+        self.visited = translator.translate("COL_VISITED")
+        self.main = translator.translate("COL_MAIN_CHALLENGE")
+        # Columns that do not refer to a challenge
+        self.special = frozenset({self.lat, self.lon, self.name, self.id, self.visited})
+
+
 class StampCount:
     def __init__(self, total: int, visited: int):
         self.total = total
         self.visited = visited
 
 
+class StampArrays:
+    """
+    Arrays extracted from the stamp DataFrame once, shared by the counting and the marker code. The flag columns
+    must only hold 0 and 1, as normalized by load_csv_data, so nonzero entries are exactly the set flags.
+    """
+    def __init__(self, df: pandas.DataFrame, cols: StampColumns):
+        self.challenge_cols = get_challenge_cols(df.columns.tolist(), cols)
+        self.challenge_matrix = df[self.challenge_cols].to_numpy(dtype=numpy.int8)
+        self.visited = df[cols.visited].to_numpy() == 1
+        self.types = classify_stamps(self.visited, df[cols.main].to_numpy() == 1, self.challenge_matrix.any(axis=1))
+
+
+class StampMarkers(folium.MacroElement):
+    """
+    Markers of all stamps, created by a single script in the browser instead of one folium.Marker per marker.
+    Each stamp lists the indices of the feature groups it is shown in and gets its own marker in each of them.
+    """
+    _template = jinja2.Template("""
+        {% macro script(this, kwargs) %}
+            (function() {
+                var groups = [{% for group in this.groups %}{{ group.get_name() }},{% endfor %}];
+                // One icon per stamp status, shared by all markers of that status
+                var icons = {{ this.colors|tojson }}.map(function(color) {
+                    return L.AwesomeMarkers.icon({
+                        markerColor: color, iconColor: "white", icon: "stamp", prefix: "fa", extraClasses: "fa-rotate-0"
+                    });
+                });
+                {{ this.stamps_json }}.forEach(function(stamp) {
+                    var popup = '<div style="width: 100.0%; height: 100.0%;">' + stamp.popup + '</div>';
+                    stamp.groups.forEach(function(group) {
+                        L.marker(stamp.location, {icon: icons[stamp.status]}).bindPopup(popup, {maxWidth: "100%"})
+                            .addTo(groups[group]);
+                    });
+                });
+            })();
+        {% endmacro %}
+    """)
+
+    def __init__(self, groups: list[folium.FeatureGroup], colors: list[str], stamps: list[dict]):
+        super().__init__()
+        self._name = "StampMarkers"
+        self.groups = groups
+        self.colors = colors
+        # Serialized without whitespace, as the payload makes up most of the generated HTML
+        self.stamps_json = jinja2.utils.htmlsafe_json_dumps(stamps, separators=(',', ':'))
+
+
 def load_csv_data(file_path: str, translator: Translator, delimiter: str = ';') -> pandas.DataFrame:
     """Load data from a CSV file."""
+    cols = StampColumns(translator)
     try:
-        return pandas.read_csv(file_path, delimiter=delimiter)
+        df = pandas.read_csv(file_path, delimiter=delimiter,
+                             dtype={cols.lat: 'float64', cols.lon: 'float64', cols.id: 'str', cols.name: 'str'})
     except FileNotFoundError:
         print(translator.translate("FILE_NOT_FOUND").format(file_path))
         return pandas.DataFrame()  # Return an empty DataFrame if file is not found
+    except ValueError as e:
+        print(translator.translate("CSV_PARSING_ERROR").format(file_path, e))
+        return pandas.DataFrame()
+    # All columns besides coordinates, name and ID are flags. Only a "1" sets a flag, anything else is stored as 0.
+    flag_cols = [cols.visited] + get_challenge_cols(df.columns.tolist(), cols)
+    df[flag_cols] = df[flag_cols].eq(1).astype('int8')
+    return df
 
 
-def create_folium_map(df: pandas.DataFrame, translator: Translator, zoom_start: int = 11) -> folium.Map:
+def create_folium_map(df: pandas.DataFrame, cols: StampColumns, zoom_start: int = 11) -> folium.Map:
     """Create a Folium map object centered on the mean of the coordinates."""
     default_tiles = folium.TileLayer('OpenStreetMap', name='OpenStreetMap', attr='OpenStreetMap')
-    return folium.Map(location=[df[translator.translate("COL_LAT")].mean(), df[translator.translate("COL_LON")].mean()],
+    return folium.Map(location=[df[cols.lat].mean(), df[cols.lon].mean()],
                       zoom_start=zoom_start, tiles=default_tiles)
 
 
@@ -118,51 +205,46 @@ def add_folium_tile_layers(map_obj: folium.Map, translator: Translator, api_key:
         folium.TileLayer(tile, name=name, attr=attr).add_to(map_obj)
 
 
-def get_stamp_type(row: pandas.Series, translator: Translator) -> StampStatus:
-    """Determine the color of the marker based on conditions."""
-    if row[translator.translate("COL_VISITED")] == 1:
-        return StampStatus.VISITED
-    elif row[translator.translate("COL_MAIN_CHALLENGE")] == 1:
-        return StampStatus.MAIN
-    elif 1 in row.values:
-        return StampStatus.THEME
-    else:
-        return StampStatus.BONUS
+def classify_stamps(visited: numpy.ndarray, main: numpy.ndarray, any_challenge: numpy.ndarray) -> numpy.ndarray:
+    """Determine the StampStatus value of every stamp from its visited, main and any-challenge flags."""
+    stamp_types = numpy.full(len(visited), StampStatus.BONUS.value, dtype=numpy.uint8)
+    # Assign in reverse order of precedence, so the highest-ranking status of a stamp wins
+    stamp_types[any_challenge] = StampStatus.THEME.value
+    stamp_types[main] = StampStatus.MAIN.value
+    stamp_types[visited] = StampStatus.VISITED.value
+    return stamp_types
 
 
-def calculate_stamp_counts(df: pandas.DataFrame, translator: Translator) \
-        -> tuple[dict[str, StampCount], dict[StampStatus, int]]:
+def calculate_stamp_counts(arrays: StampArrays) -> tuple[dict[str, StampCount], dict[StampStatus, int]]:
     """Calculate the total and visited counts of stamps for each category."""
-    categories = [col for col in df.columns if not is_special_col(col, translator)]
-    counts = {}
-    for category in categories:
-        total = df[category].sum()
-        visited = df[df[translator.translate("COL_VISITED")] == 1][category].sum()
-        counts[category] = StampCount(total, visited)
+    # One reduction over the whole matrix each, instead of one per category
+    totals = arrays.challenge_matrix.sum(axis=0)
+    visited = arrays.challenge_matrix[arrays.visited].sum(axis=0)
+    counts = {category: StampCount(int(totals[j]), int(visited[j]))
+              for j, category in enumerate(arrays.challenge_cols)}
 
-    general_counts = {StampStatus.VISITED: 0, StampStatus.MAIN: 0, StampStatus.THEME: 0, StampStatus.BONUS: 0}
-    for _, row in df.iterrows():
-        general_counts[get_stamp_type(row, translator)] += 1
+    type_counts = numpy.bincount(arrays.types, minlength=len(StampStatus))
+    general_counts = {stamp_type: int(type_counts[stamp_type.value]) for stamp_type in StampStatus}
 
     return counts, general_counts
 
 
-def is_special_col(col: str, translator: Translator) -> bool:
+def is_special_col(col: str, cols: StampColumns) -> bool:
     """Check if a column is a special column that should not be considered for challenges."""
-    return col in [translator.translate("COL_LAT"), translator.translate("COL_LON"),
-                   translator.translate("COL_NAME"), translator.translate("COL_ID"),
-                   translator.translate("COL_VISITED")]
+    return col in cols.special
+
 
+def get_challenge_cols(columns: list[str], cols: StampColumns) -> list[str]:
+    """Get the challenge columns among the given columns, in their original order."""
+    return [col for col in columns if not is_special_col(col, cols)]
 
-def build_challenge_groups(df: pandas.DataFrame, counts: dict[str, StampCount], translator: Translator) \
-        -> dict[str, folium.FeatureGroup]:
+
+def build_challenge_groups(counts: dict[str, StampCount], translator: Translator) -> dict[str, folium.FeatureGroup]:
     """Build feature groups for each challenge category."""
     feature_groups = {}
-    for col in df.columns:
-        if is_special_col(col, translator):
-            continue
-        visited_count = int(counts[col].visited)
-        total_count = int(counts[col].total)
+    for col, count in counts.items():
+        visited_count = int(count.visited)
+        total_count = int(count.total)
         name = translator.translate("CHALLENGE_TITLE").format(col, visited_count, total_count)
         feature_groups[col] = folium.FeatureGroup(name=name, show=False)
     return feature_groups
@@ -185,84 +267,170 @@ def build_status_groups(general_counts: dict[StampStatus, int], translator: Tran
     return feature_groups
 
 
-def build_marker_popup(row: pandas.Series, translator: Translator) -> str:
-    """Build the popup content for a stamp marker based on the row data."""
-    active_challenges = '</br>- '.join(
-        col for col in row.index if row[col] == 1 and col != translator.translate("COL_VISITED"))
-    marker_popup_header = "<b><u>Nr. {}</u></br>{}</b>".format(row[translator.translate("COL_ID")],
-                                                               row[translator.translate("COL_NAME")])
-    marker_popup = f"{marker_popup_header}</br>- {active_challenges}" \
-        if active_challenges \
-        else marker_popup_header
-    return marker_popup.replace(' ', '&nbsp;').replace('-', "&#8209;")
+def to_popup_text(texts: pandas.Series) -> pandas.Series:
+    """Replace spaces and hyphens with their non-breaking counterparts so popup lines do not wrap."""
+    return texts.astype(str).str.replace(' ', '&nbsp;', regex=False).str.replace('-', '&#8209;', regex=False)
+
+
+def build_marker_popup(stamp_id: str, stamp_name: str, challenges: list[str]) -> str:
+    """Build the popup content for a stamp marker from its already converted ID, name and challenges."""
+    marker_popup_header = f"<b><u>Nr.&nbsp;{stamp_id}</u></br>{stamp_name}</b>"
+    if not challenges:
+        return marker_popup_header
+    return marker_popup_header + "</br>&#8209;&nbsp;" + "</br>&#8209;&nbsp;".join(challenges)
 
 
 def build_markers(df: pandas.DataFrame, feature_groups: dict[StampStatus, folium.FeatureGroup],
-                  column_feature_groups: dict[str, folium.FeatureGroup], translator: Translator) -> None:
-    """Build a marker for each stamp in the DataFrame and add it to the corresponding feature groups."""
+                  column_feature_groups: dict[str, folium.FeatureGroup], cols: StampColumns,
+                  arrays: StampArrays) -> StampMarkers:
+    """Build the markers for all stamps in the DataFrame, assigned to their corresponding feature groups."""
     marker_colors = ['green', 'red', 'orange', 'gray']
-    for _, row in df.iterrows():
-        marker_type = get_stamp_type(row, translator)
-        marker_color = marker_colors[marker_type.value]
-        marker_popup = build_marker_popup(row, translator)
-        marker = folium.Marker(
-            location=[float(row[translator.translate("COL_LAT")]), float(row[translator.translate("COL_LON")])],
-            popup=marker_popup,
-            icon=folium.Icon(color=marker_color, icon="stamp", prefix="fa")
-        )
-        feature_groups[marker_type].add_child(marker)
-
-        for col in row.index[row == 1].tolist():
-            if not is_special_col(col, translator):
-                marker = folium.Marker(
-                    location=[float(row[translator.translate("COL_LAT")]), float(row[translator.translate("COL_LON")])],
-                    popup=marker_popup,
-                    icon=folium.Icon(color=marker_color, icon="stamp", prefix="fa")
-                )
-                column_feature_groups[col].add_child(marker)
-
-
-def plot_markers(map_obj: folium.Map, df: pandas.DataFrame, translator: Translator) -> None:
+    # Converted to Python lists of [lat, lon] in a single pass, so no per-stamp float conversion is needed
+    locations = df[[cols.lat, cols.lon]].to_numpy(dtype=numpy.float64).tolist()
+    ids = to_popup_text(df[cols.id]).to_numpy()
+    names = to_popup_text(df[cols.name]).to_numpy()
+    challenge_cols = arrays.challenge_cols
+    display_names = to_popup_text(pandas.Series(challenge_cols)).tolist()
+
+    groups = list(feature_groups.values()) + list(column_feature_groups.values())
+    status_group_index = {stamp_type: k for k, stamp_type in enumerate(feature_groups)}
+    column_group_index = {col: len(feature_groups) + k for k, col in enumerate(column_feature_groups)}
+
+    stamps = []
+    for i in range(len(df)):
+        marker_type = StampStatus(arrays.types[i])
+        # load_csv_data normalizes the flags to 0 and 1, so the nonzero entries are the stamp's challenges
+        active_idx = numpy.flatnonzero(arrays.challenge_matrix[i]).tolist()
+        stamps.append({
+            "location": locations[i],
+            "popup": build_marker_popup(ids[i], names[i], [display_names[j] for j in active_idx]),
+            "status": marker_type.value,
+            "groups": [status_group_index[marker_type]] + [column_group_index[challenge_cols[j]] for j in active_idx]
+        })
+    return StampMarkers(groups, marker_colors, stamps)
+
+
+def plot_markers(map_obj: folium.Map, df: pandas.DataFrame, cols: StampColumns, translator: Translator) -> None:
     """Plot markers for each stamp in the DataFrame."""
-    counts, general_counts = calculate_stamp_counts(df, translator)
+    # Extract the stamp data once for both the counts and the markers
+    arrays = StampArrays(df, cols)
+    counts, general_counts = calculate_stamp_counts(arrays)
 
-    challenge_layers = build_challenge_groups(df, counts, translator)
+    challenge_layers = build_challenge_groups(counts, translator)
     status_layers = build_status_groups(general_counts, translator)
 
-    build_markers(df, status_layers, challenge_layers, translator)
+    stamp_markers = build_markers(df, status_layers, challenge_layers, cols, arrays)
 
     for group in status_layers.values():
         map_obj.add_child(group)
     for group in challenge_layers.values():
         map_obj.add_child(group)
+    # The markers are added to the feature groups by script, so it must be rendered after their definitions
+    map_obj.add_child(stamp_markers)
+
+
+def parse_gpx_file(file_path: str) -> list[tuple[str, list[numpy.ndarray]]]:
+    """Parse a GPX file into the name and the segments (arrays of latitude/longitude rows) of each of its tracks."""
+    tracks = []
+    path = []
+    points = []
+    for event, elem in xml.etree.ElementTree.iterparse(file_path, events=('start', 'end')):
+        tag = elem.tag.rpartition('}')[2]  # Strip the namespace
+        if event == 'start':
+            path.append(tag)
+            if tag == 'trk':
+                tracks.append((None, []))
+            elif tag == 'trkseg':
+                points = []
+            elif tag == 'trkpt':
+                points.append((float(elem.attrib['lat']), float(elem.attrib['lon'])))
+            continue
+
+        path.pop()
+        if tag == 'name' and path[-1:] == ['trk']:
+            tracks[-1] = ((elem.text or '').strip() or None, tracks[-1][1])
+        elif tag == 'trkseg':
+            tracks[-1][1].append(numpy.array(points, dtype=numpy.float64).reshape(-1, 2))
+        if tag in ('trkpt', 'trkseg'):
+            elem.clear()  # Points are only needed as arrays, so free the parsed elements
+    return tracks
 
 
 def plot_gpx_tracks(map_obj: folium.Map, colors: list[str], translator: Translator,
                     directory: str = './routes', track_feature_group: folium.FeatureGroup = None) -> None:
     """Load and plot each GPX file's track."""
+    files = [file for file in sorted(os.listdir(directory)) if file.endswith('.gpx')]
+    if not files:
+        return
+    paths = [os.path.join(directory, file) for file in files]
+
+    # Only spread the parsing over processes if there is enough data for it to pay off
+    futures = None
+    max_workers = min(len(paths), os.cpu_count() or 1)
+    if max_workers > 1 and sum(os.path.getsize(path) for path in paths) >= GPX_PARALLEL_MIN_BYTES:
+        with concurrent.futures.ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(parse_gpx_file, path) for path in paths]
+
+    # The tracks are plotted in file order to keep the color assignment deterministic
     color_cycle = itertools.cycle(colors)
-    for file in sorted(os.listdir(directory)):
-        if file.endswith('.gpx'):
-            try:
-                with open(os.path.join(directory, file), 'r') as gpx_file:
-                    gpx = gpxpy.parse(gpx_file)
-                track_color = next(color_cycle)
-                for track in gpx.tracks:
-                    plot_track(map_obj, track, track_color, translator, track_feature_group)
-            except Exception as e:
-                print(translator.translate("PROCESSING_ERROR").format(file, e))
-
-
-def plot_track(map_obj: folium.Map, track, track_color: str,
-               translator: Translator, tfg: folium.FeatureGroup = None) -> None:
+    for k, file in enumerate(files):
+        try:
+            tracks = futures[k].result() if futures else parse_gpx_file(paths[k])
+            track_color = next(color_cycle)
+            for track_name, segments in tracks:
+                plot_track(map_obj, track_name, segments, track_color, translator, track_feature_group)
+        except Exception as e:
+            print(translator.translate("PROCESSING_ERROR").format(file, e))
+
+
+def simplify_track(points: numpy.ndarray, tolerance: float) -> numpy.ndarray:
+    """
+    Simplify a track segment with the Ramer-Douglas-Peucker algorithm, keeping every point that deviates more than
+    tolerance meters from the simplified line.
+    """
+    if len(points) < 3:
+        return points
+
+    # Project onto a local plane in meters, which is accurate enough for the extent of a single track
+    earth_radius = 6371000.0
+    xy = numpy.radians(points[:, ::-1]) * earth_radius
+    xy[:, 0] *= math.cos(math.radians(points[:, 0].mean()))
+
+    keep = numpy.zeros(len(points), dtype=bool)
+    keep[[0, -1]] = True
+    stack = [(0, len(points) - 1)]
+    while stack:
+        start, end = stack.pop()
+        if end - start < 2:
+            continue
+        direction = xy[end] - xy[start]
+        offsets = xy[start + 1:end] - xy[start]
+        # Distance to the segment between both ends rather than to the infinite line through them, so points beyond
+        # either end (e.g. on out-and-back spurs) are kept. For closed loops this is the distance to the start point.
+        squared_length = float(direction @ direction)
+        t = numpy.clip(offsets @ direction / squared_length, 0.0, 1.0) if squared_length > 0.0 \
+            else numpy.zeros(len(offsets))
+        deviations = offsets - t[:, None] * direction
+        distances = numpy.hypot(deviations[:, 0], deviations[:, 1])
+        farthest = int(numpy.argmax(distances))
+        if distances[farthest] > tolerance:
+            split = start + 1 + farthest
+            keep[split] = True
+            stack.append((start, split))
+            stack.append((split, end))
+    return points[keep]
+
+
+def plot_track(map_obj: folium.Map, track_name: str, segments: list[numpy.ndarray], track_color: str,
+               translator: Translator, tfg: folium.FeatureGroup = None, tolerance: float = 5.0) -> None:
     """Plot a single track on the map."""
-    track_name = track.name or translator.translate("UNNAMED_TRACK")
+    track_name = track_name or translator.translate("UNNAMED_TRACK")
     if tfg is None:
         track_feature_group = folium.FeatureGroup(name=translator.translate("TRAIL") + track_name, show=False)
     else:
         track_feature_group = tfg
-    for segment in track.segments:
-        points = [(point.latitude, point.longitude) for point in segment.points]
+    for points in segments:
+        points = simplify_track(points, tolerance)
         folium.PolyLine(points, color=track_color, weight=2.5, opacity=1, popup=track_name).add_to(track_feature_group)
     map_obj.add_child(track_feature_group)
 
@@ -281,6 +449,10 @@ def parse_cli() -> argparse.Namespace:
                         help="Do not automatically open the browser after generating the map.")
     parser.add_argument("--api_key", default="",
                         help="Thunderforest API key for additional tile layers.")
+    parser.add_argument("--gzip", action="store_true",
+                        help="Additionally save a gzip-compressed copy of the map next to the HTML file.")
+    parser.add_argument("--no_cache", action="store_true",
+                        help="Regenerate the map even if the inputs did not change since it was last generated.")
 
     # Parse arguments
     return parser.parse_args()
@@ -288,9 +460,10 @@ def parse_cli() -> argparse.Namespace:
 
 def plot_map(df: pandas.DataFrame, routes_dir: str, tours_dir: str, translator: Translator, api_key: str) -> folium.Map:
     """Create and plot the map with markers and GPX tracks."""
-    map_osm = create_folium_map(df, translator)
+    cols = StampColumns(translator)
+    map_osm = create_folium_map(df, cols)
     add_folium_tile_layers(map_osm, translator, api_key)
-    plot_markers(map_osm, df, translator)
+    plot_markers(map_osm, df, cols, translator)
     trail_colors = ['blue', 'green', 'red', 'purple']
     plot_gpx_tracks(map_osm, trail_colors, translator, directory=routes_dir)
 
@@ -302,6 +475,51 @@ def plot_map(df: pandas.DataFrame, routes_dir: str, tours_dir: str, translator:
     return map_osm
 
 
+def compute_input_fingerprint(args: argparse.Namespace) -> str:
+    """Compute a fingerprint of everything the generated map depends on."""
+    digest = hashlib.blake2b(digest_size=16)
+    for file_path in (os.path.abspath(__file__), args.csv_file, args.language_file):
+        with open(file_path, 'rb') as f:
+            digest.update(f.read())
+    # GPX files are only checked by modification time and size, as reading them is what the cache should avoid
+    for directory in (args.routes_dir, args.tours_dir):
+        if not os.path.isdir(directory):
+            continue
+        for file in sorted(os.listdir(directory)):
+            stat = os.stat(os.path.join(directory, file))
+            digest.update(f"{directory}/{file}:{stat.st_mtime_ns}:{stat.st_size}\n".encode('utf8'))
+    digest.update(args.api_key.encode('utf8'))
+    return digest.hexdigest()
+
+
+def get_cache_tag(fingerprint: str) -> str:
+    """Get the comment which marks a saved map as generated from inputs with the given fingerprint."""
+    return f"<!-- cache:{fingerprint} -->"
+
+
+def is_map_up_to_date(file_path: str, fingerprint: str) -> bool:
+    """Check if the (possibly gzip-compressed) map saved at the given path was generated from the given inputs."""
+    opener = gzip.open if file_path.endswith('.gz') else open
+    try:
+        with opener(file_path, 'rt', encoding='utf8') as f:
+            return f.readline().strip() == get_cache_tag(fingerprint)
+    except (OSError, EOFError, UnicodeDecodeError):
+        return False
+
+
+def save_map(map_obj: folium.Map, file_path: str, fingerprint: str, compressed_copy: bool = False) -> None:
+    """
+    Save the map as HTML file, with the cache tag of the given fingerprint in the first line. If requested, a
+    gzip-compressed copy is saved alongside with an additional '.gz' extension.
+    """
+    html = get_cache_tag(fingerprint) + "\n" + map_obj.get_root().render()
+    with open(file_path, 'w', encoding='utf8') as f:
+        f.write(html)
+    if compressed_copy:
+        with gzip.open(file_path + '.gz', 'wt', encoding='utf8', compresslevel=6) as f:
+            f.write(html)
+
+
 def main() -> None:
     """Main function to generate the map."""
     args = parse_cli()
@@ -315,12 +533,17 @@ def main() -> None:
         print(translator.translate("NO_DATA_TO_PLOT"))
         return
 
-    # Create and populate the map
-    map_osm = plot_map(df, args.routes_dir, args.tours_dir, translator, args.api_key)
+    fingerprint = compute_input_fingerprint(args)
+    outputs = [args.output, args.output + '.gz'] if args.gzip else [args.output]
+    if not args.no_cache and all(is_map_up_to_date(output, fingerprint) for output in outputs):
+        print(translator.translate("MAP_UP_TO_DATE").format(args.output))
+    else:
+        # Create and populate the map
+        map_osm = plot_map(df, args.routes_dir, args.tours_dir, translator, args.api_key)
 
-    # Save the map
-    map_osm.save(args.output)
-    print(translator.translate("MAP_SAVED_SUCCESSFULLY").format(args.output))
+        # Save the map
+        save_map(map_osm, args.output, fingerprint, compressed_copy=args.gzip)
+        print(translator.translate("MAP_SAVED_SUCCESSFULLY").format(args.output))
 
     if not args.no_browser:
         # Open the map in the browser